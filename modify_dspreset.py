@@ -1,6 +1,91 @@
-import xml.etree.ElementTree as ET
+try:
+    import lxml.etree as ET
+    # Presets are shared files: never expand external entities or fetch over the network
+    _PARSER = ET.XMLParser(resolve_entities=False, no_network=True)
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _PARSER = None
+import io
 import os
-from typing import Dict, List, Optional
+import shutil
+import sys
+from collections import defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+# Precompiled control lookup, only available when running on lxml
+_CONTROLS_XPATH = ET.XPath('//control') if hasattr(ET, 'XPath') else None
+
+# Below this many rows, plain list arithmetic beats the NumPy import and round trip
+_VECTORIZE_MIN_ROWS = 10000
+
+# Control attributes that can be offset, in display order
+_ATTRS = ('x', 'y', 'width', 'height')
+
+# Pending modification of one control; old/new line up with attrs
+Change = namedtuple('Change', 'element ctype cid attrs old new')
+
+
+def _control_type(attrib) -> str:
+    """Return the type key used to group and select a control ('unknown' when untyped)."""
+    return attrib.get('type', 'unknown')
+
+
+def _format_value(value: float) -> str:
+    """Format a coordinate as fixed-point with trailing zeros trimmed (e.g. 101.5, 64)."""
+    text = f"{value:.6f}".rstrip('0').rstrip('.')
+    return '0' if text == '-0' else text
+
+
+def _apply_offsets(values: List[List[float]], offsets: Sequence[float]) -> List[List[float]]:
+    """Add x/y/width/height offsets to each row of control values."""
+    if len(values) >= _VECTORIZE_MIN_ROWS:
+        try:
+            import numpy as np
+        except ImportError:
+            pass
+        else:
+            arr = np.array(values, dtype=np.float64)
+            arr += np.array(offsets, dtype=np.float64)
+            return arr.tolist()
+    return [[value + offset for value, offset in zip(row, offsets)] for row in values]
+
+
+def _check_extension(file_path: str) -> None:
+    """Raise ValueError unless file_path names a .dspreset file."""
+    if not file_path.endswith('.dspreset'):
+        raise ValueError("File must have .dspreset extension")
+
+
+def _read_preset(file_path: str) -> Optional[bytes]:
+    """Read raw file contents, or None if the file cannot be read."""
+    try:
+        with open(file_path, 'rb') as source:
+            return source.read()
+    except OSError:
+        return None
+
+
+def modifier_for(selected_types: Iterable[str], offsets: Sequence[float]) -> Callable[[ET.Element], None]:
+    """
+    Build a function that applies fixed x/y/width/height offsets to one control element in place.
+    The type set and non-zero offsets are resolved once, for reuse across many presets.
+    Raises ValueError from the returned function if a control has a non-numeric value.
+    """
+    types = frozenset(selected_types)
+    active = tuple((attr, offset) for attr, offset in zip(_ATTRS, offsets) if offset)
+
+    def apply(control: ET.Element) -> None:
+        attrib = control.attrib
+        if not active or _control_type(attrib) not in types:
+            return
+        # Compute every new value before writing so a bad value leaves the control untouched
+        new_values = [(attr, float(attrib.get(attr, 0)) + offset) for attr, offset in active]
+        for attr, value in new_values:
+            attrib[attr] = _format_value(value)
+
+    return apply
 
 class DSPresetModifier:
     """
@@ -8,58 +93,111 @@ class DSPresetModifier:
     Supports labels, knobs, buttons, and other DS control types.
     """
     
-    def __init__(self, file_path: str):
-        """Initialize with .dspreset file path."""
+    def __init__(self, file_path: str, data: Optional[bytes] = None):
+        """Initialize with .dspreset file path, optionally with its already-read contents."""
         self.file_path = file_path
         self.tree = None
         self.root = None
         self.ui_controls: List[ET.Element] = []
         self.control_types_found: Dict[str, int] = {}
-        self._load_file()
+        self._by_type: Dict[str, List[ET.Element]] = defaultdict(list)
+        self._load_file(data)
 
-    def _load_file(self) -> None:
+    @classmethod
+    def load_many(cls, file_paths: Iterable[str], max_workers: Optional[int] = None) -> List['DSPresetModifier']:
+        """
+        Load several .dspreset files, overlapping their reads.
+        Returns modifiers in the same order as file_paths.
+        """
+        file_paths = list(file_paths)
+        if len(file_paths) <= 1:
+            return [cls(file_path) for file_path in file_paths]
+        
+        # Reject mistyped paths before reading anything
+        for file_path in file_paths:
+            _check_extension(file_path)
+        
+        modifiers = []
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(_read_preset, file_path) for file_path in file_paths]
+            try:
+                # Parse each preset as soon as its read is done and drop its bytes right after
+                for i, file_path in enumerate(file_paths):
+                    data = futures[i].result()
+                    futures[i] = None
+                    # Unreadable files are retried by path so they raise the usual errors
+                    modifiers.append(cls(file_path, data))
+            except BaseException:
+                pool.shutdown(cancel_futures=True)
+                raise
+        return modifiers
+
+    def _load_file(self, data: Optional[bytes] = None) -> None:
         """Load and validate the .dspreset file."""
-        if not self.file_path.endswith('.dspreset'):
-            raise ValueError("File must have .dspreset extension")
+        _check_extension(self.file_path)
         
         if not os.path.exists(self.file_path):
             raise FileNotFoundError(f"File not found: {self.file_path}")
         
         try:
-            self.tree = ET.parse(self.file_path)
-            self.root = self.tree.getroot()
+            if _CONTROLS_XPATH is not None:
+                # lxml: parse and select controls entirely in C
+                # base_url keeps the file name in diagnostics and docinfo for preloaded bytes
+                self.tree = ET.parse(self.file_path if data is None else io.BytesIO(data),
+                                     parser=_PARSER, base_url=self.file_path)
+                self.root = self.tree.getroot()
+                self.ui_controls = _CONTROLS_XPATH(self.root)
+            else:
+                # Feed the parser in chunks so reading and parsing overlap in a single pass
+                parser = ET.XMLPullParser(events=('end',))
+                stream = open(self.file_path, 'rb') if data is None else io.BytesIO(data)
+                with stream:
+                    while chunk := stream.read(1 << 16):
+                        parser.feed(chunk)
+                        self._collect_controls(parser.read_events())
+                parser.close()
+                self._collect_controls(parser.read_events())
+                self.tree = ET.ElementTree(self.root)
             
             # Validate basic Decent Sampler structure
             if self.root.tag != 'DecentSampler':
                 raise ValueError("Not a valid Decent Sampler preset file (missing DecentSampler root)")
             
-            # Find UI controls
-            self.ui_controls = self.root.findall('.//control')
+            # Index controls by type so modifications only visit the selected ones
+            for control in self.ui_controls:
+                self._by_type[_control_type(control.attrib)].append(control)
+            
+            # Detect available control types
+            self.control_types_found = {control_type: len(controls)
+                                        for control_type, controls in self._by_type.items()}
+            
             if not self.ui_controls:
                 print("Warning: No control elements found in the preset")
-            else:
-                # Detect available control types
-                for control in self.ui_controls:
-                    control_type = control.get('type', 'unknown')
-                    self.control_types_found[control_type] = self.control_types_found.get(control_type, 0) + 1
                 
         except ET.ParseError as e:
-            raise ValueError(f"Invalid XML format in {self.file_path}: {e}")
+            raise ValueError(f"Invalid XML format in {self.file_path}: {e}") from e
+
+    def _collect_controls(self, events) -> None:
+        """Collect control elements from end events; the last element to end is the root."""
+        elem = None
+        for _, elem in events:
+            if elem.tag == 'control':
+                self.ui_controls.append(elem)
+        if elem is not None:
+            self.root = elem
 
     def create_backup(self) -> str:
         """Create a backup of the original file."""
         backup_path = f"{self.file_path}.backup"
         try:
-            with open(self.file_path, 'r', encoding='utf-8') as source:
-                with open(backup_path, 'w', encoding='utf-8') as backup:
-                    backup.write(source.read())
+            shutil.copyfile(self.file_path, backup_path)
             print(f"Created backup at: {backup_path}")
             return backup_path
         except IOError as e:
             raise IOError(f"Error creating backup: {e}")
 
     def modify_controls(self, 
-                        selected_types: List[str],
+                        selected_types: Iterable[str],
                         x_offset: float = 0, 
                         y_offset: float = 0, 
                         width_offset: float = 0, 
@@ -69,73 +207,90 @@ class DSPresetModifier:
         Modify position and size of specified control types.
         Returns dict with modification statistics.
         """
+        changes, stats = self._compute_changes(
+            selected_types, (x_offset, y_offset, width_offset, height_offset))
+
+        # Apply or preview changes
+        if not preview:
+            stats['modified'] = self._apply_changes(changes)
+
+        # Print changes
+        self._print_changes(changes, preview)
+        
+        return stats
+
+    def _compute_changes(self,
+                         selected_types: Iterable[str],
+                         offsets: Sequence[float]) -> Tuple[List[Change], Dict[str, int]]:
+        """
+        Calculate new x/y/width/height values for specified control types without modifying them.
+        Returns the list of changes and a dict with modification statistics.
+        """
         stats = {'found': 0, 'modified': 0, 'skipped': 0}
         changes = []
 
-        for control in self.ui_controls:
-            control_type_attr = control.get('type')
-            if control_type_attr in selected_types:
+        # Deduplicate while keeping the caller's order
+        selected_types = list(dict.fromkeys(selected_types))
+
+        # Only attributes with a non-zero offset need to be read and rewritten
+        active = [(attr, offset) for attr, offset in zip(_ATTRS, offsets) if offset]
+        if not active:
+            stats['found'] = sum(len(self._by_type.get(control_type, ())) for control_type in selected_types)
+            return changes, stats
+        attrs = tuple(attr for attr, _ in active)
+
+        selected = []
+        values = []
+
+        for control_type_attr in selected_types:
+            for control in self._by_type.get(control_type_attr, ()):
+                attrib = control.attrib
                 stats['found'] += 1
+                control_id = attrib['id'] if 'id' in attrib else attrib.get('label', 'unnamed')
                 try:
                     # Get current values
-                    x = float(control.get('x', 0))
-                    y = float(control.get('y', 0))
-                    width = float(control.get('width', 0))
-                    height = float(control.get('height', 0))
-                    
-                    # Calculate new values
-                    new_x = x + x_offset
-                    new_y = y + y_offset
-                    new_width = width + width_offset
-                    new_height = height + height_offset
-                    
-                    # Store changes for preview or application
-                    change = {
-                        'id': control.get('id', control.get('label', 'unnamed')),
-                        'type': control_type_attr,
-                        'old': {'x': x, 'y': y, 'width': width, 'height': height},
-                        'new': {'x': new_x, 'y': new_y, 'width': new_width, 'height': new_height},
-                        'element': control
-                    }
-                    changes.append(change)
-                    
+                    values.append([float(attrib.get(attr, 0)) for attr in attrs])
+                    selected.append((control, control_type_attr, control_id))
                 except (ValueError, TypeError) as e:
-                    print(f"Warning: Invalid values for control {control.get('id', 'unnamed')}: {e}")
+                    print(f"Warning: Invalid values for control {attrib.get('id', 'unnamed')}: {e}")
                     stats['skipped'] += 1
                     continue
 
-        # Apply or preview changes
-        if not preview and changes:
-            for change in changes:
-                control = change['element']
-                new_vals = change['new']
-                for attr, value in new_vals.items():
-                    control.set(attr, str(value))
-                stats['modified'] += 1
+        # Calculate new values for all selected controls in one batch
+        new_values = _apply_offsets(values, [offset for _, offset in active])
 
-        # Print changes
-        self._print_changes(changes, preview)
-        
-        return stats
+        # Store changes for preview or application
+        for (control, control_type_attr, control_id), old_row, new_row in zip(selected, values, new_values):
+            changes.append(Change(control, control_type_attr, control_id, attrs, tuple(old_row), tuple(new_row)))
+
+        return changes, stats
 
-    def _print_changes(self, changes: List[Dict], preview: bool = False) -> None:
+    def _apply_changes(self, changes: List[Change]) -> int:
+        """Write previously computed changes to their control elements. Returns number modified."""
+        for change in changes:
+            attrib = change.element.attrib
+            for attr, value in zip(change.attrs, change.new):
+                attrib[attr] = _format_value(value)
+        return len(changes)
+
+    def _print_changes(self, changes: List[Change], preview: bool = False) -> None:
         """Print detailed change information."""
         if not changes:
-            print("\nNo controls selected for modification.")
+            print("\nNo control changes to apply.")
             return
 
         mode = "Preview of changes" if preview else "Applied changes"
         print(f"\n{mode}:")
         print("-" * 50)
         
+        separator = "-" * 30
         for change in changes:
-            print(f"Control ID: {change['id']} (Type: {change['type']})")
-            for attr in ['x', 'y', 'width', 'height']:
-                old_val = change['old'][attr]
-                new_val = change['new'][attr]
+            lines = [f"Control ID: {change.cid} (Type: {change.ctype})"]
+            for attr, old_val, new_val in zip(change.attrs, change.old, change.new):
                 if old_val != new_val:
-                    print(f"  {attr}: {old_val:>8.1f} → {new_val:>8.1f}")
-            print("-" * 30)
+                    lines.append(f"  {attr}: {old_val:>8.1f} → {new_val:>8.1f}")
+            lines.append(separator)
+            sys.stdout.write('\n'.join(lines) + '\n')
 
     def save(self, output_path: Optional[str] = None) -> None:
         """Save modifications to file."""
@@ -146,7 +301,9 @@ class DSPresetModifier:
             if not output_path:
                 self.create_backup()
             
-            self.tree.write(save_path, encoding='utf-8', xml_declaration=True)
+            # Large buffer so big presets go out in few write calls
+            with open(save_path, 'wb', buffering=1 << 20) as output:
+                self.tree.write(output, encoding='utf-8', xml_declaration=True)
             print(f"Successfully saved to: {save_path}")
             
         except IOError as e:
@@ -193,28 +350,27 @@ def main():
         height_offset = float(input("Height change: "))
         
         # Preview changes
-        stats = modifier.modify_controls(
-            selected_types=selected_types,
-            x_offset=x_offset,
-            y_offset=y_offset,
-            width_offset=width_offset,
-            height_offset=height_offset,
-            preview=True
-        )
+        offsets = (x_offset, y_offset, width_offset, height_offset)
+        changes, stats = modifier._compute_changes(selected_types, offsets)
         
         if stats['found'] == 0:
             print("\nNo controls found for the selected types.")
             return
         
+        # Nothing to write, so don't prompt, back up or rewrite the preset
+        if not changes:
+            if not any(offsets):
+                print("\nAll offsets are zero; no changes to apply.")
+            else:
+                print("\nNo selected controls have valid values to modify.")
+            return
+        
+        modifier._print_changes(changes, preview=True)
+        
         # Confirm changes
         if input("\nApply these changes? (y/n): ").lower() == 'y':
-            stats = modifier.modify_controls(
-                selected_types=selected_types,
-                x_offset=x_offset,
-                y_offset=y_offset,
-                width_offset=width_offset,
-                height_offset=height_offset
-            )
+            modifier._apply_changes(changes)
+            modifier._print_changes(changes)
             modifier.save()
             
     except Exception as e: